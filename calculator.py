@@ -1,7 +1,7 @@
 """Calculator class with basic mathematical operations."""
 
-import math
-from typing import Union
+from math import isfinite, sqrt
+from typing import Iterable, List, Sequence, Tuple, Union
 
 Number = Union[int, float]
 
@@ -9,6 +9,10 @@ Number = Union[int, float]
 class Calculator:
     """A calculator class with basic mathematical operations."""
     
+    __slots__ = ('last_result',)
+    
+    OPERATIONS = ('add', 'subtract', 'multiply', 'divide', 'power', 'square_root')
+    
     def __init__(self):
         self.last_result = 0
     
@@ -39,8 +43,13 @@ class Calculator:
         try:
             if base < 0 and not isinstance(exponent, int):
                 raise ValueError("Cannot raise negative number to non-integer power")
-            result = base ** exponent
-            if math.isnan(result) or math.isinf(result):
+            if exponent == 2 and type(exponent) is int and type(base) is int:
+                # Integer squares are exact either way; skip the generic ** dispatch
+                result = base * base
+            else:
+                result = base ** exponent
+            # isfinite rejects NaN and both infinities in a single call
+            if not isfinite(result):
                 raise ValueError("Operation resulted in invalid number")
             self.last_result = result
             return result
@@ -51,10 +60,22 @@ class Calculator:
         """Calculate square root of a number."""
         if number < 0:
             raise ValueError("Cannot calculate square root of negative number")
-        result = math.sqrt(number)
+        result = sqrt(number)
         self.last_result = result
         return result
     
+    def batch(self, operations: Iterable[Tuple[str, Sequence[Number]]]) -> List[Number]:
+        """Evaluate (operation, operands) pairs in order and return their results."""
+        # Resolve the bound methods once instead of on every operation
+        dispatch = {name: getattr(self, name) for name in self.OPERATIONS}
+        results = []
+        for operation, operands in operations:
+            method = dispatch.get(operation)
+            if method is None:
+                raise ValueError(f"Unknown operation: {operation}")
+            results.append(method(*operands))
+        return results
+    
     def get_last_result(self) -> Number:
         return self.last_result
     
@@ -1,52 +1,133 @@
 """History class for storing and managing calculator operation history."""
 
+import sys
+from collections import defaultdict, deque
 from datetime import datetime
-from typing import List, Dict, Any
+from itertools import islice
+from typing import List, Dict, Any, DefaultDict, Deque, Iterator, NamedTuple, Optional, Sequence, Tuple
+
+
+class OpEntry(NamedTuple):
+    """A single recorded operation; timestamp is None if it was never recorded."""
+    timestamp: Optional[datetime]
+    operation: str
+    operands: Tuple[float, ...]
+    result: float
+
+
+# Builds an OpEntry from a 4-tuple without the Python-level NamedTuple.__new__
+_new_entry = tuple.__new__
+
+
+def _public_entry(entry: OpEntry) -> Dict[str, Any]:
+    """Expose an entry as the dict shape returned by the public API."""
+    return {
+        'timestamp': entry.timestamp,
+        'operation': entry.operation,
+        'operands': list(entry.operands),
+        'result': entry.result
+    }
 
 
 class History:
     """Manages history of calculator operations."""
     
+    __slots__ = ('max_size', 'operations', '_by_type', '_results')
+    
     def __init__(self, max_size: int = 100):
         self.max_size = max_size
-        self.operations: List[Dict[str, Any]] = []
+        self.operations: Deque[OpEntry] = deque(maxlen=max_size)
+        # Per-type index of the same entries, oldest first, for search and stats
+        self._by_type: DefaultDict[str, Deque[OpEntry]] = defaultdict(deque)
+        # Results column kept alongside the entries, evicted in lockstep
+        self._results: Deque[float] = deque(maxlen=max_size)
     
-    def add_operation(self, operation: str, operands: List[float], result: float) -> None:
+    def add_operation(self, operation: str, operands: Sequence[float], result: float) -> None:
         """Add an operation to history."""
-        entry = {
-            'timestamp': datetime.now(),
-            'operation': operation,
-            'operands': operands.copy(),
-            'result': result
-        }
+        # tuple() returns a tuple argument as is, so callers passing tuples avoid a copy
+        entry = _new_entry(OpEntry, (datetime.now(), operation, tuple(operands), result))
         
-        self.operations.append(entry)
+        # A full deque drops its oldest entry on append, so account for it first
+        if len(self.operations) == self.operations.maxlen:
+            if not self.operations:
+                return
+            self._unindex_oldest(self.operations[0].operation)
         
-        # Remove oldest entries if we exceed max_size
-        if len(self.operations) > self.max_size:
-            self.operations.pop(0)
+        self.operations.append(entry)
+        self._by_type[operation].append(entry)
+        self._results.append(result)
+    
+    def load_operations(self, operations: List[Dict[str, Any]]) -> None:
+        """Replace history with previously saved operations, oldest first."""
+        # Build the new contents first so a rejected entry leaves history unchanged
+        loaded: Deque[OpEntry] = deque(maxlen=self.max_size)
+        for op in operations:
+            # Entries saved without a timestamp keep it unset
+            timestamp = op.get('timestamp')
+            if timestamp is not None and not isinstance(timestamp, datetime):
+                raise TypeError(f"Invalid timestamp in history entry: {timestamp!r}")
+            loaded.append(_new_entry(OpEntry, (
+                timestamp,
+                # Decoded names are fresh strings; interning matches the literals
+                # used on insert, so index lookups hit on identity
+                sys.intern(op['operation']),
+                tuple(op['operands']),
+                op['result']
+            )))
+        self.operations = loaded
+        self._by_type = defaultdict(deque)
+        for entry in self.operations:
+            self._by_type[entry.operation].append(entry)
+        self._results = deque((entry.result for entry in self.operations), maxlen=self.max_size)
+    
+    def _unindex_oldest(self, operation: str) -> None:
+        """Drop the oldest indexed entry of a type when it is evicted."""
+        same_type = self._by_type[operation]
+        same_type.popleft()
+        if not same_type:
+            del self._by_type[operation]
     
     def get_last_operations(self, count: int = 10) -> List[Dict[str, Any]]:
         """Get the last N operations, most recent first."""
         if count <= 0:
             return []
-        return self.operations[-count:][::-1]
+        return list(self.iter_last_operations(count))
     
     def get_all_operations(self) -> List[Dict[str, Any]]:
         """Get all operations in history, most recent first."""
-        return self.operations[::-1]
+        return list(self.iter_last_operations())
+    
+    def iter_last_operations(self, count: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """Lazily iterate over the last N operations (all by default), most recent first.
+        
+        The iterator reads the live history; adding or clearing operations
+        before it is exhausted makes it raise RuntimeError.
+        """
+        recent = reversed(self.operations)
+        if count is not None:
+            recent = islice(recent, max(count, 0))
+        return map(_public_entry, recent)
+    
+    def iter_operations(self) -> Iterator[Dict[str, Any]]:
+        """Iterate over all operations, oldest first, e.g. for saving.
+        
+        Like iter_last_operations, this reads the live history and must be
+        consumed before the history changes.
+        """
+        return map(_public_entry, self.operations)
     
     def clear_history(self) -> None:
         """Clear all operations from history."""
         self.operations.clear()
+        self._by_type.clear()
+        self._results.clear()
     
     def get_operation_count(self) -> int:
         return len(self.operations)
     
     def search_operations(self, operation_type: str) -> List[Dict[str, Any]]:
         """Search for operations by type."""
-        matching_ops = [op for op in self.operations if op['operation'] == operation_type]
-        return matching_ops[::-1]
+        return [_public_entry(op) for op in reversed(self._by_type.get(operation_type, ()))]
     
     def get_statistics(self) -> Dict[str, Any]:
         """Get statistics about the operations history."""
@@ -59,18 +140,14 @@ class History:
                 'min_result': None
             }
         
-        operation_types = {}
-        results = []
-        
-        for op in self.operations:
-            op_type = op['operation']
-            operation_types[op_type] = operation_types.get(op_type, 0) + 1
-            results.append(op['result'])
+        # Type counts come from the index and results from their own column
+        results = self._results
+        total = len(results)
         
         return {
-            'total_operations': len(self.operations),
-            'operation_types': operation_types,
-            'average_result': sum(results) / len(results),
+            'total_operations': total,
+            'operation_types': {op_type: len(ops) for op_type, ops in self._by_type.items()},
+            'average_result': sum(results) / total,
             'max_result': max(results),
             'min_result': min(results)
         }
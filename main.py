@@ -8,6 +8,8 @@ from persistence import HistoryPersistence
 class CalculatorWithHistory:
     """Calculator with operation history tracking."""
     
+    __slots__ = ('calculator', 'history', 'persistence')
+    
     def __init__(self, persistence_file: str = None):
         self.calculator = Calculator()
         self.history = History()
@@ -15,37 +17,41 @@ class CalculatorWithHistory:
     
     def add(self, a: float, b: float) -> float:
         result = self.calculator.add(a, b)
-        self.history.add_operation('add', [a, b], result)
+        self.history.add_operation('add', (a, b), result)
         return result
     
     def subtract(self, a: float, b: float) -> float:
         result = self.calculator.subtract(a, b)
-        self.history.add_operation('subtract', [a, b], result)
+        self.history.add_operation('subtract', (a, b), result)
         return result
     
     def multiply(self, a: float, b: float) -> float:
         result = self.calculator.multiply(a, b)
-        self.history.add_operation('multiply', [a, b], result)
+        self.history.add_operation('multiply', (a, b), result)
         return result
     
     def divide(self, a: float, b: float) -> float:
         result = self.calculator.divide(a, b)
-        self.history.add_operation('divide', [a, b], result)
+        self.history.add_operation('divide', (a, b), result)
         return result
     
     def power(self, base: float, exponent: float) -> float:
         result = self.calculator.power(base, exponent)
-        self.history.add_operation('power', [base, exponent], result)
+        self.history.add_operation('power', (base, exponent), result)
         return result
     
     def square_root(self, number: float) -> float:
         result = self.calculator.square_root(number)
-        self.history.add_operation('square_root', [number], result)
+        self.history.add_operation('square_root', (number,), result)
         return result
     
     def get_history(self, count: int = 10):
         return self.history.get_last_operations(count)
     
+    def iter_history(self, count: int = 10):
+        """Lazily iterate over the last N operations, most recent first."""
+        return self.history.iter_last_operations(count)
+    
     def clear_history(self):
         self.history.clear_history()
     
@@ -56,7 +62,7 @@ class CalculatorWithHistory:
         """Save history to file using persistence layer."""
         if self.persistence is None:
             raise ValueError("No persistence file configured")
-        return self.persistence.save_history(self.history.operations)
+        return self.persistence.save_history(self.history.iter_operations())
     
     def load_from_file(self) -> bool:
         """Load history from file using persistence layer."""
@@ -64,7 +70,7 @@ class CalculatorWithHistory:
             raise ValueError("No persistence file configured")
         loaded_ops = self.persistence.load_history()
         if loaded_ops:
-            self.history.operations = loaded_ops
+            self.history.load_operations(loaded_ops)
             return True
         return False
 
@@ -86,7 +92,7 @@ def main():
     
     print("\nOperation History:")
     print("-" * 20)
-    for i, op in enumerate(calc.get_history(), 1):
+    for i, op in enumerate(calc.iter_history(), 1):
         operands_str = ', '.join(map(str, op['operands']))
         print(f"{i}. {op['operation']}({operands_str}) = {op['result']}")
     
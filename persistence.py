@@ -1,10 +1,142 @@
 """Persistence module for saving and loading calculator history."""
 
 import json
+import mmap
+import os
+import re
 from datetime import datetime
-from typing import List, Dict, Any
+from math import isfinite
+from typing import Iterable, List, Dict, Any, NotRequired, Optional, TypedDict, Union
 from pathlib import Path
 
+try:
+    import msgspec
+except ImportError:  # optional schema-typed decoder
+    msgspec = None
+
+try:
+    import orjson
+except ImportError:  # optional speedup, fall back to the stdlib encoder
+    orjson = None
+
+_WRITE_BUFFER_SIZE = 64 * 1024
+# Files at least this large are parsed from a memory map instead of a bytes copy
+_MMAP_THRESHOLD = 64 * 1024
+# Integer range the fast encoders can write
+_FAST_INT_MIN = -2 ** 63
+_FAST_INT_MAX = 2 ** 64 - 1
+# orjson reads integers of this many digits or more as floats
+_LONG_INT = re.compile(rb'\d{19}')
+
+
+class _OpRecord(TypedDict):
+    """Schema of a saved history entry, as decoded by msgspec."""
+    timestamp: NotRequired[Optional[datetime]]
+    operation: str
+    operands: List[Union[int, float]]
+    result: Union[int, float]
+
+
+def _encode_default(value: Any) -> Any:
+    """Serialize values the stdlib JSON encoder does not handle."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+# Compact separators keep the output small. Unlike orjson/msgspec this encoder
+# also writes Infinity/NaN and big ints, so the backends' output is not identical.
+_json_encode = json.JSONEncoder(
+    default=_encode_default, ensure_ascii=False, separators=(',', ':')
+).encode
+
+
+def _orjson_loads(data: Any) -> Any:
+    """Decode with orjson, refusing input whose integers it would turn into floats."""
+    if _LONG_INT.search(data) is not None:
+        raise ValueError("Integer too large for orjson")
+    return orjson.loads(data)
+
+
+# Optional fast backends, chosen once at import time; None means stdlib json only
+if orjson is not None:
+    # orjson writes datetime objects as ISO strings natively
+    _fast_dumps = orjson.dumps
+elif msgspec is not None:
+    _fast_dumps = msgspec.json.Encoder().encode
+else:
+    _fast_dumps = None
+
+# msgspec validates against the schema and parses timestamps while decoding
+if msgspec is not None:
+    _fast_loads = msgspec.json.Decoder(List[_OpRecord]).decode
+elif orjson is not None:
+    _fast_loads = _orjson_loads
+else:
+    _fast_loads = None
+
+
+def _fast_encodable(value: Any) -> bool:
+    """Check that a number survives the fast encoders unchanged."""
+    if type(value) is float:
+        # Both write NaN and infinities as null
+        return isfinite(value)
+    if type(value) is int:
+        return _FAST_INT_MIN <= value <= _FAST_INT_MAX
+    return True
+
+
+def _dumps(entry: Dict[str, Any]) -> bytes:
+    """Encode a single history entry as UTF-8 JSON."""
+    if _fast_dumps is not None and _fast_encodable(entry.get('result')) and all(
+            map(_fast_encodable, entry.get('operands', ()))):
+        return _fast_dumps(entry)
+    return _json_encode(entry).encode('utf-8')
+
+
+def _loads(data: Any) -> Any:
+    """Decode a whole history file, using stdlib json for what the fast decoder rejects."""
+    if _fast_loads is not None:
+        try:
+            return _fast_loads(data)
+        except ValueError:
+            # e.g. Infinity, huge integers or a malformed entry, which stdlib json
+            # reads back and load_history then checks entry by entry
+            pass
+    return json.loads(bytes(data))
+
+
+def _load_file(path: Path) -> Any:
+    """Parse a JSON file, mapping large files into memory."""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size < _MMAP_THRESHOLD:
+            return _loads(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                return _loads(view)
+
+
+def _is_number(value: Any) -> bool:
+    return type(value) is int or type(value) is float
+
+
+def _load_entry(op: Any) -> Optional[Dict[str, Any]]:
+    """Check a decoded entry and parse its timestamp, or return None if malformed."""
+    if not (isinstance(op, dict) and type(op.get('operation')) is str
+            and isinstance(op.get('operands'), list) and all(map(_is_number, op['operands']))
+            and _is_number(op.get('result'))):
+        return None
+    # Only msgspec decodes timestamps; the other decoders leave ISO strings
+    timestamp = op.get('timestamp')
+    if type(timestamp) is str:
+        try:
+            op['timestamp'] = datetime.fromisoformat(timestamp)
+        except ValueError:
+            return None
+    elif timestamp is not None and not isinstance(timestamp, datetime):
+        return None
+    return op
+
 
 class HistoryPersistence:
     """Handles saving and loading calculator history to/from JSON files."""
@@ -12,22 +144,28 @@ class HistoryPersistence:
     def __init__(self, file_path: str = "calculator_history.json"):
         self.file_path = Path(file_path)
     
-    def save_history(self, operations: List[Dict[str, Any]]) -> bool:
+    def save_history(self, operations: Iterable[Dict[str, Any]]) -> bool:
         """Save operations history to a JSON file."""
+        # Write next to the target and swap it in, so a failed save keeps the old file
+        temp_path = self.file_path.with_name(self.file_path.name + '.tmp')
         try:
-            # Convert datetime objects to strings for JSON serialization
-            serializable_ops = []
-            for op in operations:
-                op_copy = op.copy()
-                if 'timestamp' in op_copy and isinstance(op_copy['timestamp'], datetime):
-                    op_copy['timestamp'] = op_copy['timestamp'].isoformat()
-                serializable_ops.append(op_copy)
-            
-            with open(self.file_path, 'w', encoding='utf-8') as f:
-                json.dump(serializable_ops, f, indent=2, ensure_ascii=False)
+            try:
+                # Entries are streamed one per line, without building a serialized copy
+                with open(temp_path, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+                    f.write(b'[')
+                    separator = b'\n'
+                    for op in operations:
+                        f.write(separator)
+                        f.write(_dumps(op))
+                        separator = b',\n'
+                    f.write(b'\n]\n')
+                os.replace(temp_path, self.file_path)
+            except BaseException:
+                temp_path.unlink(missing_ok=True)
+                raise
             
             return True
-        except (IOError, OSError) as e:
+        except (IOError, OSError, TypeError, ValueError) as e:
             print(f"Error saving history: {e}")
             return False
     
@@ -37,16 +175,20 @@ class HistoryPersistence:
             if not self.file_path.exists():
                 return []
             
-            with open(self.file_path, 'r', encoding='utf-8') as f:
-                operations = json.load(f)
+            decoded = _load_file(self.file_path)
+            if not isinstance(decoded, list):
+                raise ValueError("History file does not contain a list of operations")
             
-            # Convert timestamp strings back to datetime objects
-            for op in operations:
-                if 'timestamp' in op and isinstance(op['timestamp'], str):
-                    op['timestamp'] = datetime.fromisoformat(op['timestamp'])
+            operations = []
+            for op in decoded:
+                entry = _load_entry(op)
+                if entry is None:
+                    print(f"Skipping invalid history entry: {op!r}")
+                else:
+                    operations.append(entry)
             
             return operations
-        except (IOError, OSError, json.JSONDecodeError) as e:
+        except (IOError, OSError, ValueError) as e:
             print(f"Error loading history: {e}")
             return []
     
@@ -8,9 +8,12 @@ and HistoryPersistence.
 import pytest
 import os
 import json
-from datetime import datetime
+import time
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from typing import List
 
+import persistence
 from calculator import Calculator
 from history import History
 from main import CalculatorWithHistory
@@ -160,6 +163,33 @@ class TestCalculatorHistoryIntegration:
         history = calc.get_history()
         results = [op['result'] for op in reversed(history)]
         assert results == [6, 7, 8, 9, 10]  # Last 5 operations
+    
+    def test_statistics_after_history_eviction(self):
+        """
+        Integration Test 5a: Statistics and Search After Eviction
+        Tests that type counts and searches only cover operations still in history.
+        
+        Integration Points:
+        - History size management
+        - Incrementally maintained per-type index
+        """
+        calc = CalculatorWithHistory()
+        calc.history = History(max_size=3)
+        
+        calc.multiply(2, 3)
+        calc.add(1, 1)
+        calc.add(2, 2)
+        calc.subtract(9, 4)
+        
+        stats = calc.get_statistics()
+        assert stats['total_operations'] == 3
+        assert stats['operation_types'] == {'add': 2, 'subtract': 1}
+        assert stats['max_result'] == 5
+        assert stats['min_result'] == 2
+        
+        assert calc.history.search_operations('multiply') == []
+        add_ops = calc.history.search_operations('add')
+        assert [op['result'] for op in add_ops] == [4, 2]
 
 
 class TestPersistenceIntegration:
@@ -270,6 +300,245 @@ class TestPersistenceIntegration:
         assert stats['operation_types']['add'] == 20
 
 
+@pytest.fixture(params=['stdlib', 'orjson', 'msgspec'])
+def persistence_backend(request, monkeypatch):
+    """Force HistoryPersistence onto one JSON backend."""
+    if request.param == 'stdlib':
+        dumps = loads = None
+    elif request.param == 'orjson':
+        orjson = pytest.importorskip('orjson')
+        dumps, loads = orjson.dumps, persistence._orjson_loads
+    else:
+        msgspec = pytest.importorskip('msgspec')
+        dumps = msgspec.json.Encoder().encode
+        loads = msgspec.json.Decoder(List[persistence._OpRecord]).decode
+    monkeypatch.setattr(persistence, '_fast_dumps', dumps)
+    monkeypatch.setattr(persistence, '_fast_loads', loads)
+    return request.param
+
+
+@pytest.fixture
+def new_york_tz(monkeypatch):
+    """Run the test with a local timezone that has DST transitions."""
+    if not hasattr(time, 'tzset'):
+        pytest.skip("time.tzset() is not available on this platform")
+    monkeypatch.setenv('TZ', 'America/New_York')
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+class TestPersistenceBackends:
+    """Test that every JSON backend round-trips history the same way."""
+    
+    def test_round_trip_preserves_numbers(self, persistence_backend, tmp_path):
+        """
+        Integration Test 8a: Number Fidelity Across Backends
+        Tests that ints, huge ints and infinities survive save/load.
+        
+        Integration Points:
+        - CalculatorWithHistory → HistoryPersistence encoders
+        - HistoryPersistence decoders → History
+        """
+        test_file = str(tmp_path / "history.json")
+        calc = CalculatorWithHistory(persistence_file=test_file)
+        calc.add(1, 2)
+        calc.power(2, 100)
+        calc.multiply(1e308, 10)
+        
+        assert calc.save_to_file() is True
+        
+        loaded_calc = CalculatorWithHistory(persistence_file=test_file)
+        assert loaded_calc.load_from_file() is True
+        
+        results = [op['result'] for op in loaded_calc.get_history()]
+        assert results == [float('inf'), 2 ** 100, 3]
+        assert type(results[1]) is int
+        assert type(results[2]) is int
+        assert loaded_calc.get_history()[2]['operands'] == [1, 2]
+    
+    def test_failed_save_keeps_previous_file(self, persistence_backend, tmp_path):
+        """
+        Integration Test 8b: Atomic Save
+        Tests that a save failing partway leaves the previous file untouched.
+        
+        Integration Points:
+        - HistoryPersistence.save_history() error handling
+        - File system interaction
+        """
+        test_file = tmp_path / "history.json"
+        history_persistence = HistoryPersistence(str(test_file))
+        good_ops = [{'operation': 'add', 'operands': [1, 2], 'result': 3}]
+        assert history_persistence.save_history(good_ops) is True
+        saved_bytes = test_file.read_bytes()
+        
+        bad_ops = good_ops + [{'operation': 'add', 'operands': [object()], 'result': 0}]
+        assert history_persistence.save_history(bad_ops) is False
+        
+        assert test_file.read_bytes() == saved_bytes
+        assert os.listdir(tmp_path) == ["history.json"]
+    
+    def test_large_history_loads_from_memory_map(self, persistence_backend, tmp_path, monkeypatch):
+        """
+        Integration Test 8c: Large History Files
+        Tests that files above the mapping threshold load through a memory map.
+        
+        Integration Points:
+        - Large History → HistoryPersistence.save_history()
+        - Memory-mapped HistoryPersistence.load_history() → History
+        """
+        test_file = tmp_path / "history.json"
+        calc = CalculatorWithHistory(persistence_file=str(test_file))
+        calc.history = History(max_size=2000)
+        for i in range(2000):
+            calc.add(i, 0.5)
+        assert calc.save_to_file() is True
+        assert test_file.stat().st_size >= persistence._MMAP_THRESHOLD
+        
+        decoded_types = []
+        original_loads = persistence._loads
+        
+        def recording_loads(data):
+            decoded_types.append(type(data))
+            return original_loads(data)
+        
+        monkeypatch.setattr(persistence, '_loads', recording_loads)
+        
+        loaded_calc = CalculatorWithHistory(persistence_file=str(test_file))
+        loaded_calc.history = History(max_size=2000)
+        assert loaded_calc.load_from_file() is True
+        
+        assert decoded_types == [memoryview]
+        assert loaded_calc.history.get_operation_count() == 2000
+        assert loaded_calc.get_history(1)[0]['result'] == 1999.5
+    
+    def test_load_indented_baseline_file(self, persistence_backend, tmp_path):
+        """
+        Integration Test 8d: Legacy File Format
+        Tests loading an indented file written by the stdlib json encoder.
+        
+        Integration Points:
+        - Existing history files → HistoryPersistence.load_history()
+        """
+        test_file = tmp_path / "history.json"
+        with open(test_file, 'w', encoding='utf-8') as f:
+            json.dump([
+                {'timestamp': '2024-01-02T03:04:05.678901', 'operation': 'add',
+                 'operands': [10, 5], 'result': 15},
+                {'timestamp': '2024-01-02T03:04:06', 'operation': 'multiply',
+                 'operands': [1e308, 10], 'result': float('inf')},
+            ], f, indent=2)
+        
+        operations = HistoryPersistence(str(test_file)).load_history()
+        
+        assert len(operations) == 2
+        assert operations[0]['timestamp'] == datetime(2024, 1, 2, 3, 4, 5, 678901)
+        assert operations[0]['operands'] == [10, 5]
+        assert type(operations[0]['result']) is int
+        assert operations[1]['result'] == float('inf')
+    
+    def test_malformed_entries_are_skipped(self, persistence_backend, tmp_path):
+        """
+        Integration Test 8e: Malformed Entries
+        Tests that invalid entries are skipped without losing the valid ones.
+        
+        Integration Points:
+        - HistoryPersistence.load_history() validation
+        - CalculatorWithHistory.load_from_file() → History
+        """
+        test_file = tmp_path / "history.json"
+        with open(test_file, 'w', encoding='utf-8') as f:
+            json.dump([
+                {'timestamp': '2024-01-02T03:04:05', 'operation': 'add',
+                 'operands': [1, 2], 'result': 3},
+                {'timestamp': '2024-01-02T03:04:06', 'operation': 'add', 'operands': [1, 2]},
+                {'timestamp': '2024-01-02T03:04:07', 'operation': 42,
+                 'operands': [1, 2], 'result': 3},
+                {'timestamp': '2024-01-02T03:04:08', 'operation': 'multiply',
+                 'operands': [1e308, 10], 'result': None},
+                {'timestamp': 'yesterday', 'operation': 'add', 'operands': [1, 2], 'result': 3},
+                {'timestamp': '2024-01-02T03:04:09', 'operation': 'subtract',
+                 'operands': [5, 2], 'result': 3},
+            ], f)
+        
+        calc = CalculatorWithHistory(persistence_file=str(test_file))
+        assert calc.load_from_file() is True
+        
+        assert [op['operation'] for op in calc.get_history()] == ['subtract', 'add']
+        assert calc.get_statistics()['operation_types'] == {'add': 1, 'subtract': 1}
+    
+    def test_missing_timestamps_stay_unset(self, persistence_backend, tmp_path):
+        """
+        Integration Test 8f: Entries Without Timestamps
+        Tests that entries saved without a timestamp are not given one on load.
+        
+        Integration Points:
+        - HistoryPersistence.load_history() → History.load_operations()
+        - History → HistoryPersistence.save_history()
+        """
+        test_file = tmp_path / "history.json"
+        with open(test_file, 'w', encoding='utf-8') as f:
+            json.dump([
+                {'operation': 'add', 'operands': [1, 2], 'result': 3},
+                {'timestamp': None, 'operation': 'add', 'operands': [2, 2], 'result': 4},
+            ], f)
+        
+        calc = CalculatorWithHistory(persistence_file=str(test_file))
+        assert calc.load_from_file() is True
+        assert [op['timestamp'] for op in calc.get_history()] == [None, None]
+        
+        assert calc.save_to_file() is True
+        reloaded = HistoryPersistence(str(test_file)).load_history()
+        assert [op['timestamp'] for op in reloaded] == [None, None]
+    
+    def test_loaded_timestamps_are_unchanged(self, persistence_backend, new_york_tz, tmp_path):
+        """
+        Integration Test 8g: Timestamp Fidelity
+        Tests that loaded timestamps come back exactly as saved, in any local timezone.
+        
+        Integration Points:
+        - HistoryPersistence.load_history() → History.load_operations()
+        - History → HistoryPersistence.save_history()
+        """
+        expected = [
+            datetime(2024, 3, 10, 2, 30),  # inside the New York DST gap
+            datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone(timedelta(hours=5))),
+            datetime.min,
+        ]
+        test_file = tmp_path / "history.json"
+        with open(test_file, 'w', encoding='utf-8') as f:
+            json.dump([
+                {'timestamp': ts.isoformat(), 'operation': 'add', 'operands': [1, 2], 'result': 3}
+                for ts in expected
+            ], f)
+        
+        calc = CalculatorWithHistory(persistence_file=str(test_file))
+        assert calc.load_from_file() is True
+        loaded = [op['timestamp'] for op in reversed(calc.get_history())]
+        assert loaded == expected
+        assert loaded[1].utcoffset() == timedelta(hours=5)
+        
+        assert calc.save_to_file() is True
+        reloaded = HistoryPersistence(str(test_file)).load_history()
+        assert [op['timestamp'] for op in reloaded] == expected
+    
+    def test_non_list_file_is_a_load_error(self, persistence_backend, tmp_path):
+        """
+        Integration Test 8h: Unexpected File Contents
+        Tests that a JSON file without a list of operations loads nothing.
+        
+        Integration Points:
+        - HistoryPersistence.load_history() error handling
+        """
+        test_file = tmp_path / "history.json"
+        test_file.write_text('{"operation": "add"}', encoding='utf-8')
+        
+        calc = CalculatorWithHistory(persistence_file=str(test_file))
+        assert calc.load_from_file() is False
+        assert calc.history.get_operation_count() == 0
+
+
 class TestComplexScenarios:
     """Test complex real-world scenarios involving all modules."""
     
@@ -413,6 +682,100 @@ class TestModuleBoundaries:
         # Both should produce same mathematical results
         assert calc.multiply(4, 5) == calc_with_hist.multiply(4, 5)
     
+    def test_calculator_batch_evaluation(self):
+        """
+        Integration Test 12a: Batch Evaluation
+        Verify batch evaluation matches the scalar operations.
+        
+        Tests the contract between Calculator.batch() and the single operations.
+        """
+        calc = Calculator()
+        results = calc.batch([
+            ('add', (10, 5)),
+            ('divide', (9, 3)),
+            ('power', (2, 8)),
+            ('square_root', (16,)),
+        ])
+        
+        assert results == [15, 3.0, 256, 4.0]
+        assert calc.get_last_result() == 4.0
+        
+        with pytest.raises(ZeroDivisionError):
+            calc.batch([('add', (1, 1)), ('divide', (1, 0))])
+        
+        with pytest.raises(ValueError):
+            calc.batch([('modulo', (5, 2))])
+    
+    def test_history_iterators_integration(self):
+        """
+        Integration Test 12b: Lazy History Iteration
+        Tests the history iterators against the list-returning accessors.
+        
+        Integration Points:
+        - CalculatorWithHistory.iter_history() → History.iter_last_operations()
+        - History.iter_operations() ordering
+        - Iteration over a history that changes underneath
+        """
+        calc = CalculatorWithHistory()
+        calc.add(1, 2)
+        calc.multiply(3, 4)
+        calc.subtract(9, 4)
+        
+        assert list(calc.iter_history()) == calc.get_history()
+        assert [op['result'] for op in calc.iter_history(2)] == [5, 12]
+        assert list(calc.history.iter_last_operations()) == calc.history.get_all_operations()
+        assert list(calc.history.iter_last_operations(-1)) == []
+        assert [op['operation'] for op in calc.history.iter_operations()] == [
+            'add', 'multiply', 'subtract'
+        ]
+        
+        iterator = calc.iter_history()
+        next(iterator)
+        calc.add(5, 5)
+        with pytest.raises(RuntimeError):
+            next(iterator)
+    
+    def test_history_load_operations(self):
+        """
+        Integration Test 12c: Replacing History Contents
+        Tests History.load_operations() against the size limit and indexes.
+        
+        Integration Points:
+        - Loaded operations → History storage, type index and results
+        - Statistics and search over loaded history
+        """
+        history = History(max_size=2)
+        history.add_operation('divide', (8, 2), 4.0)
+        history.load_operations([
+            {'timestamp': datetime(2024, 1, 2, 3, 4, 5), 'operation': 'add',
+             'operands': [1, 2], 'result': 3},
+            {'timestamp': datetime(2024, 1, 2, 3, 4, 6), 'operation': 'add',
+             'operands': [2, 2], 'result': 4},
+            {'timestamp': datetime(2024, 1, 2, 3, 4, 7), 'operation': 'multiply',
+             'operands': [2, 5], 'result': 10},
+        ])
+        
+        assert history.get_operation_count() == 2
+        assert history.search_operations('divide') == []
+        assert [op['result'] for op in history.search_operations('add')] == [4]
+        assert history.get_last_operations(1)[0] == {
+            'timestamp': datetime(2024, 1, 2, 3, 4, 7),
+            'operation': 'multiply',
+            'operands': [2, 5],
+            'result': 10
+        }
+        
+        stats = history.get_statistics()
+        assert stats['operation_types'] == {'add': 1, 'multiply': 1}
+        assert stats['min_result'] == 4
+        assert stats['max_result'] == 10
+        
+        with pytest.raises(TypeError):
+            history.load_operations([
+                {'timestamp': 'today', 'operation': 'add', 'operands': [1, 2], 'result': 3}
+            ])
+        assert history.get_operation_count() == 2
+    
     def test_history_search_integration(self):
         """
         Integration Test 13: History Search Functionality